@@ -1,53 +1,92 @@
-import json
 import os
+import sys
+import webbrowser
+from collections import Counter, defaultdict
+from functools import lru_cache
+from itertools import combinations, product
+import ijson
 import networkx as nx
+import orjson
 from pyvis.network import Network
 
 HTML_name= "directed_coauthors_india.html"
+# Above this many edges we skip PyVis' Jinja template and write a static page + data file
+LARGE_GRAPH_EDGES = 5000
+
+STATIC_HTML_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<script src="https://unpkg.com/vis-network@9.1.2/standalone/umd/vis-network.min.js"></script>
+<style>#mynetwork {{ width: {width}; height: {height}; background-color: {bgcolor}; }}</style>
+</head>
+<body>
+<div id="mynetwork"></div>
+<script src="{data_src}"></script>
+<script>
+  new vis.Network(document.getElementById("mynetwork"),
+                  {{nodes: new vis.DataSet(networkData.nodes), edges: new vis.DataSet(networkData.edges)}},
+                  networkData.options);
+</script>
+</body>
+</html>
+"""
 
 ##############################################################################
 # 1. Load Data from JSON Files
 ##############################################################################
 
-def load_and_merge_data(file_paths):
+def iter_articles(file_paths):
     """
-    Loads JSON records from multiple files, returns a single list of article records.
+    Stream-parses JSON records from multiple files, yielding one article record at a time
+    so the whole dataset never has to sit in memory.
     """
-    all_data = []
     for fpath in file_paths:
         if not os.path.exists(fpath):
             print(f"WARNING: File not found -> {fpath}")
             continue
-        with open(fpath, "r", encoding="utf-8") as f:
+        with open(fpath, "rb") as f:
             try:
-                data = json.load(f)
-                all_data.extend(data)
+                yield from ijson.items(f, "item")
             except Exception as e:
                 print(f"Error reading {fpath}: {e}")
-    return all_data
 
 
 ##############################################################################
 # 2. Build a PARTIALLY DIRECTED Graph
 ##############################################################################
 
+@lru_cache(maxsize=None)
 def normalize_name(name: str) -> str:
     """
     A simple approach to normalizing names:
       - lowercase
       - strip whitespace
+    Cached and interned, since the same names recur across many articles:
+    every node key and edge endpoint for a person then shares one string object.
     """
-    return name.strip().lower()
+    return sys.intern(name.strip().lower())
 
 def build_partially_directed_graph(articles):
     """
-    Creates a DiGraph:
-      - editor->author edges are single directed edges
-      - co-author relationships are added in BOTH directions, simulating undirected edges.
+    Creates the two halves of the partially directed graph:
+      - G_auth: an undirected Graph of co-author relationships (one edge per pair)
+      - G_ed:   a DiGraph of editor->author relationships
+    Both graphs contain every person as a node, each graph with its own copy
+    of the node attributes.
+
+    Node and edge attributes are accumulated in plain dicts in a single pass over
+    the articles (any iterable, e.g. the iter_articles stream) and handed to
+    NetworkX in one batch at the end. The number of articles seen is stored as
+    G_ed.graph['article_count'].
     """
-    G = nx.DiGraph()
+    article_count = 0
+    node_acc = {}
+    co_acc = {}
+    ed_acc = {}
 
     for entry in articles:
+        article_count += 1
         title = entry.get("title", "")
         journal = entry.get("journal", "")
         special_issue = entry.get("special_issue", "")
@@ -58,92 +97,81 @@ def build_partially_directed_graph(articles):
 
         # Normalize names
         editors = [normalize_name(e) for e in editors_raw]
-        authors = [normalize_name(a) for a in authors_raw]
+        # (deduplicated, so no author pairs with themselves)
+        authors = list(dict.fromkeys(normalize_name(a) for a in authors_raw))
 
         # Update node attributes
         for ed in editors:
-            if not G.has_node(ed):
-                G.add_node(ed, name=ed, editor_count=0, author_count=0)
-            G.nodes[ed]['editor_count'] += 1
-
+            attrs = node_acc.get(ed)
+            if attrs is None:
+                attrs = node_acc[ed] = {'name': ed, 'editor_count': 0, 'author_count': 0}
+            attrs['editor_count'] += 1
         for au in authors:
-            if not G.has_node(au):
-                G.add_node(au, name=au, editor_count=0, author_count=0)
-            G.nodes[au]['author_count'] += 1
+            attrs = node_acc.get(au)
+            if attrs is None:
+                attrs = node_acc[au] = {'name': au, 'editor_count': 0, 'author_count': 0}
+            attrs['author_count'] += 1
+
+        # Edge attributes: dict keys act as an insertion-ordered set, so repeats
+        # of the same issue/title for a pair are stored only once
 
         # Directed edges: editor->author
-        for ed in editors:
-            for au in authors:
-                if not G.has_edge(ed, au):
-                    G.add_edge(ed, au,
-                               relationship='editor_to_author',
-                               issues=[issue_id],
-                               titles=[title])
-                else:
-                    # If an edge already exists (maybe co-author),
-                    # just append metadata
-                    edge_data = G[ed][au]
-                    if 'editor_to_author' not in edge_data.get('relationship',''):
-                        edge_data['relationship'] += ',editor_to_author'
-                    edge_data.setdefault('issues', []).append(issue_id)
-                    edge_data.setdefault('titles', []).append(title)
-
-        # Co-author edges: add in BOTH directions
-        for i in range(len(authors)):
-            for j in range(i+1, len(authors)):
-                a1, a2 = authors[i], authors[j]
-                # a1 -> a2
-                if not G.has_edge(a1, a2):
-                    G.add_edge(a1, a2,
-                               relationship='co_author',
-                               issues=[issue_id],
-                               titles=[title])
-                else:
-                    # update existing edge
-                    edge_data = G[a1][a2]
-                    if 'co_author' not in edge_data.get('relationship',''):
-                        edge_data['relationship'] += ',co_author'
-                    edge_data.setdefault('issues', []).append(issue_id)
-                    edge_data.setdefault('titles', []).append(title)
-
-                # a2 -> a1 (the "reverse" co-author edge)
-                if not G.has_edge(a2, a1):
-                    G.add_edge(a2, a1,
-                               relationship='co_author',
-                               issues=[issue_id],
-                               titles=[title])
-                else:
-                    edge_data = G[a2][a1]
-                    if 'co_author' not in edge_data.get('relationship',''):
-                        edge_data['relationship'] += ',co_author'
-                    edge_data.setdefault('issues', []).append(issue_id)
-                    edge_data.setdefault('titles', []).append(title)
-
-    return G
+        for key in product(editors, authors):
+            d = ed_acc.get(key)
+            if d is None:
+                d = ed_acc[key] = {'issues': {}, 'titles': {}}
+            d['issues'][issue_id] = None
+            d['titles'][title] = None
+
+        # Co-author edges: one canonical (sorted) key per pair
+        for a1, a2 in combinations(authors, 2):
+            key = (a1, a2) if a1 < a2 else (a2, a1)
+            d = co_acc.get(key)
+            if d is None:
+                d = co_acc[key] = {'issues': {}, 'titles': {}}
+            d['issues'][issue_id] = None
+            d['titles'][title] = None
+
+    for acc in (co_acc, ed_acc):
+        for attrs in acc.values():
+            attrs['issues'] = list(attrs['issues'])
+            attrs['titles'] = list(attrs['titles'])
+
+    G_auth = nx.Graph()
+    G_auth.add_nodes_from(node_acc.items())
+    G_auth.add_edges_from((u, v, attrs) for (u, v), attrs in co_acc.items())
+
+    G_ed = nx.DiGraph(article_count=article_count)
+    G_ed.add_nodes_from(node_acc.items())
+    G_ed.add_edges_from((u, v, attrs) for (u, v), attrs in ed_acc.items())
+    return G_auth, G_ed
 
 
 ##############################################################################
 # 3. Detect Suspicious Overlaps
 ##############################################################################
 
-def detect_suspicious_patterns(G):
+def detect_suspicious_patterns(G_ed):
     """
-    We'll do:
+    Works on the editor->author DiGraph. We'll do:
      - SELF OVERLAP: Person is both editor + author in the same special issue.
      - RECIPROCAL: PersonA edits PersonB's article(s), and PersonB edits PersonA's article(s).
     """
     suspicious_self = []
     suspicious_recip = []
 
-    # We'll store person->issue->roles
-    person_issue_roles = {}
+    # We'll store person->issue->roles, and all editor->author edges in a dict
+    person_issue_roles = defaultdict(lambda: defaultdict(set))
+    ed_au_map = {}
 
-    # For each 'editor_to_author' edge, record (editor) has 'editor' in that issue, (author) has 'author'.
-    for (u, v, data) in G.edges(data=True):
-        if 'editor_to_author' in data.get('relationship',''):
-            for iss in data.get('issues', []):
-                person_issue_roles.setdefault(u, {}).setdefault(iss, set()).add('editor')
-                person_issue_roles.setdefault(v, {}).setdefault(iss, set()).add('author')
+    # Single pass over the editor->author edges: record (editor) has 'editor' in
+    # that issue, (author) has 'author', and remember the issues for the reciprocal check.
+    for (u, v, data) in G_ed.edges(data=True):
+        issues = data.get('issues', [])  # already unique per edge
+        for iss in issues:
+            person_issue_roles[u][iss].add('editor')
+            person_issue_roles[v][iss].add('author')
+        ed_au_map[(u, v)] = list(issues)  # a copy, so callers can't mutate G_ed through the results
 
     # SELF OVERLAP (same person has 'editor' and 'author' in same issue)
     for person, issue_roles_dict in person_issue_roles.items():
@@ -155,14 +183,6 @@ def detect_suspicious_patterns(G):
                 })
 
     # RECIPROCAL: if we have (u->v) in some issue, and (v->u) in some issue
-    # We'll gather all editor->author edges in a dict
-    ed_au_map = {}
-    for (u, v, data) in G.edges(data=True):
-        if 'editor_to_author' in data.get('relationship',''):
-            for iss in data.get('issues', []):
-                ed_au_map.setdefault((u, v), []).append(iss)
-
-    # If (u->v) and (v->u), that's a reciprocal
     for (u,v), issues_uv in ed_au_map.items():
         if (v,u) in ed_au_map:
             issues_vu = ed_au_map[(v,u)]
@@ -189,17 +209,14 @@ def score_suspicion(suspicions):
       +3 for each self-overlap
       +2 for each reciprocal
     """
-    score_map = {}
+    score_map = Counter()
 
     for s in suspicions['self_overlap']:
-        p = s['person']
-        score_map[p] = score_map.get(p, 0) + 3
+        score_map[s['person']] += 3
 
     for r in suspicions['reciprocal']:
-        A = r['personA']
-        B = r['personB']
-        score_map[A] = score_map.get(A, 0) + 2
-        score_map[B] = score_map.get(B, 0) + 2
+        score_map[r['personA']] += 2
+        score_map[r['personB']] += 2
 
     return score_map
 
@@ -208,80 +225,95 @@ def score_suspicion(suspicions):
 # 5. Co-Author Cluster Analysis
 ##############################################################################
 
-def find_coauthor_clusters_directed(G):
+def find_coauthor_clusters_directed(G_auth):
     """
-    Even though the graph is directed, co-author edges are duplicated.
-    We'll convert the co-author subgraph to undirected, then find connected components.
+    Co-author edges already live in an undirected Graph, so the clusters are
+    simply its connected components (ignoring trivial pairs).
     """
-    co_edges = []
-    for (u, v, data) in G.edges(data=True):
-        if 'co_author' in data.get('relationship',''):
-            co_edges.append((u, v))
-
-    co_subgraph = G.edge_subgraph(co_edges).copy()
-    # Convert to undirected for cluster analysis
-    co_undirected = co_subgraph.to_undirected()
-    components = nx.connected_components(co_undirected)
-
-    clusters = []
-    for comp in components:
-        comp_list = sorted(list(comp))
-        if len(comp_list) > 2:  # ignoring trivial pairs
-            clusters.append(comp_list)
-    return clusters
+    return [sorted(c) for c in nx.connected_components(G_auth) if len(c) > 2]
 
 
 ##############################################################################
 # 6. Visualization with PyVis
 ##############################################################################
 
-def visualize_partially_directed(G, output_html=HTML_name):
+def visualize_partially_directed(G_auth, G_ed, output_html=HTML_name, scores=None):
     """
-    Creates an interactive PyVis network where:
+    Composes the co-author Graph and the editor->author DiGraph into one
+    interactive PyVis network where:
       - We highlight editor->author edges with arrows='to'
-      - We highlight co-author edges with arrows='to, from'
-        (actually, we store 2 edges in G, so you'll see it in the final rendered result).
+      - We highlight co-author edges with arrows='to;from'
+        (G_auth is undirected, so both arrowheads are drawn here).
+    Pass the suspicion `scores` if they have already been computed; otherwise
+    they are derived from G_ed here.
     """
     net = Network(height="800px", width="100%", directed=True, bgcolor="#222222", font_color="white")
     net.force_atlas_2based()
 
     # We'll gather suspicion scores to color nodes
-    suspicions = detect_suspicious_patterns(G)
-    scores = score_suspicion(suspicions)
+    if scores is None:
+        scores = score_suspicion(detect_suspicious_patterns(G_ed))
 
     # Add nodes
-    for node in G.nodes():
-        sc = scores.get(node, 0)
-        color = "#00ff00"
+    # net.add_node/add_edge do a linear membership scan over all nodes on every call,
+    # so we build the same option dicts PyVis would and append them in one batch.
+    def pick_color(sc):
         if sc > 0:
-            color = "#ff9900" if sc < 5 else "#ff0000"
-        net.add_node(node, label=node, title=f"Suspicion: {sc}", color=color)
+            return "#ff9900" if sc < 5 else "#ff0000"
+        return "#00ff00"
+
+    node_dicts = []
+    for node in G_ed.nodes():
+        sc = scores.get(node, 0)
+        node_dicts.append({'id': node, 'label': node, 'shape': 'dot',
+                           'title': f"Suspicion: {sc}", 'color': pick_color(sc),
+                           'font': {'color': net.font_color}})
+    net.nodes.extend(node_dicts)
+    net.node_ids.extend(nd['id'] for nd in node_dicts)
+    net.node_map.update((nd['id'], nd) for nd in node_dicts)
 
     # Add edges
     # We'll differentiate the arrow style for co_author vs. editor_to_author
-    # but in practice PyVis might show them similarly. We'll add a 'label' or 'title' to clarify.
-    for (u, v, data) in G.edges(data=True):
-        rel = data.get('relationship','')
-        if 'editor_to_author' in rel:
-            net.add_edge(u, v,
-                         label="editor->author",
-                         title=f"{rel}, {data.get('issues','')}",
-                         arrows='to')
-        elif 'co_author' in rel:
-            # We already store co-author in both directions. We'll just mark arrows='to'.
-            # The user will see it as effectively "undirected" because there's an edge each way.
-            net.add_edge(u, v,
-                         label="co_author",
-                         title=f"{rel}, {data.get('issues','')}",
-                         arrows='to')
-        else:
-            # If other relationships exist
-            net.add_edge(u, v, label=rel, arrows='to')
-
-    net.show(output_html, notebook=False)
+    # and add a 'label' and 'title' to clarify.
+    net.edges.extend({'from': u, 'to': v,
+                      'label': "editor->author",
+                      'title': f"editor_to_author, {data.get('issues','')}",
+                      'arrows': 'to'}
+                     for (u, v, data) in G_ed.edges(data=True))
+    # Co-author pairs are undirected; draw both arrowheads.
+    net.edges.extend({'from': u, 'to': v,
+                      'label': "co_author",
+                      'title': f"co_author, {data.get('issues','')}",
+                      'arrows': 'to;from'}
+                     for (u, v, data) in G_auth.edges(data=True))
+
+    if len(net.edges) > LARGE_GRAPH_EDGES:
+        write_static_network(net, output_html)
+    else:
+        net.show(output_html, notebook=False)
     print(f"[Visualization] Saved to: {output_html}")
 
 
+def write_static_network(net, output_html):
+    """
+    Writes a PyVis network without going through its template: a small static HTML
+    shell that loads vis-network from a CDN, plus a <name>_data.js file holding the
+    nodes/edges/options encoded once with orjson. vis-network is pinned to 9.1.2,
+    the version PyVis ships. Like net.show, the page is then opened in the browser.
+    (A .js file rather than fetch('data.json'), so the page still opens from file://.)
+    """
+    data_name = os.path.splitext(output_html)[0] + "_data.js"
+    with open(data_name, "wb") as f:
+        f.write(b'var networkData = {"nodes":' + orjson.dumps(net.nodes)
+                + b',"edges":' + orjson.dumps(net.edges)
+                + b',"options":' + net.options.to_json().encode("utf-8") + b'};\n')
+
+    with open(output_html, "w", encoding="utf-8") as f:
+        f.write(STATIC_HTML_TEMPLATE.format(width=net.width, height=net.height, bgcolor=net.bgcolor,
+                                            data_src=os.path.basename(data_name)))
+    webbrowser.open(output_html)
+
+
 ##############################################################################
 # MAIN
 ##############################################################################
@@ -297,15 +329,16 @@ def main():
     file_paths = [
         "mdpi_sustainability_INDIA_articles.json"
     ]
-    articles = load_and_merge_data(file_paths)
-    print(f"Loaded {len(articles)} articles.")
+    articles = iter_articles(file_paths)
 
-    # 2. Build partial DiGraph
-    G = build_partially_directed_graph(articles)
-    print(f"Constructed DiGraph with {G.number_of_nodes()} nodes, {G.number_of_edges()} edges.")
+    # 2. Build co-author Graph + editor->author DiGraph (consumes the article stream)
+    G_auth, G_ed = build_partially_directed_graph(articles)
+    print(f"Loaded {G_ed.graph['article_count']} articles.")
+    print(f"Constructed graphs with {G_ed.number_of_nodes()} nodes, "
+          f"{G_auth.number_of_edges()} co-author edges, {G_ed.number_of_edges()} editor->author edges.")
 
     # 3. Detect suspicious patterns
-    susp = detect_suspicious_patterns(G)
+    susp = detect_suspicious_patterns(G_ed)
     scores = score_suspicion(susp)
 
     print("\n--- Self Overlaps (editor=author in same issue) ---")
@@ -321,11 +354,11 @@ def main():
         print(f"       B_ed_A_auth issues: {r_item['issues_B_ed_A_auth']}\n")
 
     print("\n--- Suspicion Scores ---")
-    for person, sc in sorted(scores.items(), key=lambda x: -x[1]):
+    for person, sc in scores.most_common():
         print(f"   {person}: {sc}")
 
     # 4. Co-author clusters
-    clusters = find_coauthor_clusters_directed(G)
+    clusters = find_coauthor_clusters_directed(G_auth)
     if clusters:
         print("\n--- Potential Co-Author Clusters (undirected approach) ---")
         for c in clusters:
@@ -334,7 +367,7 @@ def main():
         print("\nNo co-author clusters with more than 2 members found.")
 
     # 5. Visualization
-    visualize_partially_directed(G, HTML_name)
+    visualize_partially_directed(G_auth, G_ed, HTML_name, scores=scores)
 
 
 if __name__ == "__main__":
@@ -1,119 +1,189 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser
 import time
-import json
-import signal
+import orjson
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 journal = "sustainability"
 country = "INDIA"
 file_name = f"mdpi_{journal}_{country}_articles.json"
-
-
-def signal_handler(signum, frame):
-    print("Script interrupted. Saving current data to file.")
-    with open(file_name, 'w', encoding='utf-8') as f:
-        json.dump(all_articles, f, ensure_ascii=False, indent=2)
-    exit()
-
-
-# Setup signal handler for keyboard interrupt (Ctrl+C)
-signal.signal(signal.SIGINT, signal_handler)
+checkpoint_name = file_name + '.ndjson'  # one article per line, appended as we go
+max_workers = 8  # concurrent article-page fetches
+requests_per_second = 2  # aggregate request rate across all workers, to avoid overloading the server
+
+
+class RateLimiter:
+    # Spaces out calls from any number of threads so they never exceed `rate` per second
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self.lock = threading.Lock()
+        self.next_slot = time.monotonic()
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            slot = max(self.next_slot, now)
+            self.next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+rate_limiter = RateLimiter(requests_per_second)
+
+# One shared session so every request reuses pooled keep-alive connections (no new TLS handshake each time)
+SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+})
+adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=Retry(total=3, backoff_factor=0.5))
+SESSION.mount('https://', adapter)
+SESSION.mount('http://', adapter)
+
+
+def save_articles(articles):
+    # Write to a temp file and swap it in, so an interrupted write never leaves a truncated file
+    tmp_name = file_name + '.tmp'
+    with open(tmp_name, 'wb') as f:
+        f.write(orjson.dumps(articles, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_name, file_name)
+    # The JSON array now holds everything, so the NDJSON checkpoint is no longer needed
+    if os.path.exists(checkpoint_name):
+        os.remove(checkpoint_name)
+
+
+def append_checkpoint(article):
+    # O(1) per article: only the new record is written, earlier ones are never rewritten
+    with open(checkpoint_name, 'ab') as f:
+        f.write(orjson.dumps(article) + b'\n')
+
+
+def recover_checkpoint():
+    # A non-empty checkpoint means an earlier run died before writing its JSON array.
+    # Convert it to a separate JSON file instead of truncating it.
+    if not os.path.exists(checkpoint_name) or os.path.getsize(checkpoint_name) == 0:
+        return
+    recovered = []
+    with open(checkpoint_name, 'rb') as f:
+        for line in f:
+            try:
+                recovered.append(orjson.loads(line))
+            except orjson.JSONDecodeError:
+                pass  # e.g. a last line cut off mid-write
+    recovered_name = f"{os.path.splitext(file_name)[0]}_recovered_{time.strftime('%Y%m%d-%H%M%S')}.json"
+    with open(recovered_name, 'wb') as f:
+        f.write(orjson.dumps(recovered, option=orjson.OPT_INDENT_2))
+    os.remove(checkpoint_name)
+    print(f"Recovered {len(recovered)} articles from an unfinished run into {recovered_name}")
 
 
 def get_editors(article_url):
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-
-    response = requests.get(article_url, headers=headers)
+    rate_limiter.wait()
+    response = SESSION.get(article_url)
     if response.status_code != 200:
         print(f"Failed to retrieve article page. Status code: {response.status_code}")
         return []
 
-    soup = BeautifulSoup(response.text, 'html.parser')
-    editors_div = soup.find('div', id='academic_editors')
+    tree = LexborHTMLParser(response.text)
+    editors_div = tree.css_first('div#academic_editors')
     if not editors_div:
         return []
 
     editors = []
-    for editor_container in editors_div.find_all('div', class_='academic-editor-container'):
-        editor_name = editor_container.find('span', class_='sciprofiles-link__name')
+    for editor_container in editors_div.css('div.academic-editor-container'):
+        editor_name = editor_container.css_first('span.sciprofiles-link__name')
         if editor_name:
-            editors.append(editor_name.text.strip())
+            editors.append(editor_name.text().strip())
 
     return editors
 
 
 def scrape_mdpi_articles(url, num_pages):
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-
-    global all_articles  # Make it global to access in the signal handler
     all_articles = []
-    for page_no in range(1, num_pages + 1):  # Loop through the number of pages
-        page_url = f"{url}&page_no={page_no}" if page_no > 1 else url  # Add page_no parameter for pages after first
-
-        response = requests.get(page_url, headers=headers)
-        if response.status_code != 200:
-            print(f"Failed to retrieve page {page_no}. Status code: {response.status_code}")
-            continue
-
-        soup = BeautifulSoup(response.text, 'html.parser')
-        articles = soup.find_all('div', class_='generic-item article-item')
-
-        for article in articles:
-            article_data = {}
-
-            # Title and Link
-            title_link = article.find('a', class_='title-link')
-            if title_link:
-                article_data['title'] = title_link.text.strip()
-                article_data['link'] = title_link['href']
-            else:
-                article_data['title'] = ""
-                article_data['link'] = ""
-
-            # Authors
-            authors = article.find('div', class_='authors')
-            if authors:
-                author_spans = authors.find_all('span', class_='inlineblock')
-                article_data['authors'] = [author.find('strong').text.strip() for author in author_spans]
-            else:
-                article_data['authors'] = []
-
-            # Journal and Year
-            journal_info = article.find('div', class_='color-grey-dark')
-            if journal_info:
-                journal_text = journal_info.text.strip()
-                journal_parts = journal_text.split(',')
-                article_data['journal'] = journal_parts[0].strip().replace('<em>', '').replace('</em>', '')
-                article_data['year'] = journal_parts[1].strip()
-            else:
-                article_data['journal'] = ""
-                article_data['year'] = ""
-
-            # Special Issue
-            special_issue = article.find('div', class_='belongsTo')
-            if special_issue:
-                link = special_issue.find('a')
-                if link:
-                    article_data['special_issue'] = link.text.strip()
-                else:
-                    article_data['special_issue'] = ""
-            else:
-                article_data['special_issue'] = ""
-
-            # Editors
-            article_data['editors'] = get_editors('https://www.mdpi.com' + article_data['link'])
-
-            all_articles.append(article_data)
-
-            # Write to JSON after each article to ensure data is saved if interrupted
-            with open(file_name, 'w', encoding='utf-8') as f:
-                json.dump(all_articles, f, ensure_ascii=False, indent=2)
-
-            time.sleep(1)  # Wait between requests to avoid overloading the server
+    recover_checkpoint()
+    open(checkpoint_name, 'wb').close()  # start a fresh checkpoint for this run
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for page_no in range(1, num_pages + 1):  # Loop through the number of pages
+                page_url = f"{url}&page_no={page_no}" if page_no > 1 else url  # Add page_no parameter for pages after first
+
+                rate_limiter.wait()
+                response = SESSION.get(page_url)
+                if response.status_code != 200:
+                    print(f"Failed to retrieve page {page_no}. Status code: {response.status_code}")
+                    continue
+
+                tree = LexborHTMLParser(response.text)
+                articles = tree.css('div.generic-item.article-item')
+
+                page_articles = []
+                for article in articles:
+                    article_data = {}
+
+                    # Title and Link
+                    title_link = article.css_first('a.title-link')
+                    if title_link:
+                        article_data['title'] = title_link.text().strip()
+                        article_data['link'] = title_link.attributes['href']
+                    else:
+                        article_data['title'] = ""
+                        article_data['link'] = ""
+
+                    # Authors
+                    authors = article.css_first('div.authors')
+                    if authors:
+                        author_spans = authors.css('span.inlineblock')
+                        article_data['authors'] = [author.css_first('strong').text().strip() for author in author_spans]
+                    else:
+                        article_data['authors'] = []
+
+                    # Journal and Year
+                    journal_info = article.css_first('div.color-grey-dark')
+                    if journal_info:
+                        journal_text = journal_info.text().strip()
+                        journal_parts = journal_text.split(',')
+                        article_data['journal'] = journal_parts[0].strip().replace('<em>', '').replace('</em>', '')
+                        article_data['year'] = journal_parts[1].strip()
+                    else:
+                        article_data['journal'] = ""
+                        article_data['year'] = ""
+
+                    # Special Issue
+                    special_issue = article.css_first('div.belongsTo')
+                    if special_issue:
+                        link = special_issue.css_first('a')
+                        if link:
+                            article_data['special_issue'] = link.text().strip()
+                        else:
+                            article_data['special_issue'] = ""
+                    else:
+                        article_data['special_issue'] = ""
+
+                    page_articles.append(article_data)
+
+                # Editors: fetch all article pages of this listing page concurrently (rate limited)
+                article_urls = ['https://www.mdpi.com' + a['link'] for a in page_articles]
+                for article_data, editors in zip(page_articles, executor.map(get_editors, article_urls)):
+                    article_data['editors'] = editors
+
+                    all_articles.append(article_data)
+
+                    # Append to the NDJSON checkpoint after each article to ensure data is saved if interrupted
+                    append_checkpoint(article_data)
+    except KeyboardInterrupt:
+        # Ctrl+C: leaving executor.map cancels the queued fetches, and the finally block saves
+        print("Script interrupted. Saving current data to file.")
+        exit()
+    finally:
+        # Always leave a valid JSON array on disk, even if an error escapes the loop,
+        # but never replace the last complete scrape with an empty list
+        if all_articles:
+            save_articles(all_articles)
+        elif os.path.exists(checkpoint_name):
+            os.remove(checkpoint_name)
 
     return all_articles
 
@@ -134,10 +204,8 @@ def main():
         print(f"Editors: {', '.join(article['editors'])}")
         print("---")
 
-    # If the script completes normally, we save the final state
-    print("Scraping completed. Saving all data to file.")
-    with open(file_name, 'w', encoding='utf-8') as f:
-        json.dump(articles, f, ensure_ascii=False, indent=2)
+    # scrape_mdpi_articles has already saved the final state
+    print(f"Scraping completed. All data saved to {file_name}.")
 
 
 if __name__ == "__main__":